@@ -11,12 +11,28 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import json
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any
 
 import boto3
+from botocore.config import Config as BotoConfig
+from pydantic_core import from_json, to_json
+
+from src.inference.utilities import BEDROCK_MAX_CONCURRENCY
+
+# Adaptive client-side retries (3 attempts with backoff) on throttling / 5xx /
+# connection errors only; botocore never retries other 4xx.
+AWS_RETRY_CONFIG = BotoConfig(retries={"mode": "adaptive", "total_max_attempts": 3})
+
+# Shared by every bedrock-runtime client. The urllib3 pool (connection/TLS reuse)
+# is sized to the in-flight cap so each permitted call gets a pooled connection;
+# tcp_keepalive only sets SO_KEEPALIVE, so the OS probes idle pooled connections
+# and a silently dropped one fails instead of hanging.
+BEDROCK_BOTO_CONFIG = AWS_RETRY_CONFIG.merge(
+    BotoConfig(max_pool_connections=BEDROCK_MAX_CONCURRENCY, tcp_keepalive=True)
+)
 
 
 @dataclass
@@ -40,6 +56,7 @@ class BedrockClient:
         self.config = config
         self.refresh_skew_seconds = refresh_skew_seconds
         self._cached: _CachedBedrock | None = None
+        self._lock = threading.Lock()
 
     # -------- Cognito helpers --------
     def _compute_secret_hash(self, username: str) -> str | None:
@@ -77,7 +94,7 @@ class BedrockClient:
                 "Missing required Cognito config keys: " + ", ".join(missing)
             )
 
-        idp = boto3.client("cognito-idp", region_name=self.region_name)
+        idp = boto3.client("cognito-idp", region_name=self.region_name, config=AWS_RETRY_CONFIG)
         auth_params: dict[str, str] = {"USERNAME": username, "PASSWORD": password}
         secret_hash = self._compute_secret_hash(username)
         if secret_hash:
@@ -91,7 +108,7 @@ class BedrockClient:
         id_token = auth["AuthenticationResult"]["IdToken"]
 
         provider = f"cognito-idp.{self.region_name}.amazonaws.com/{user_pool_id}"
-        ident = boto3.client("cognito-identity", region_name=self.region_name)
+        ident = boto3.client("cognito-identity", region_name=self.region_name, config=AWS_RETRY_CONFIG)
         identity_id = ident.get_id(
             IdentityPoolId=identity_pool_id,
             Logins={provider: id_token},
@@ -112,11 +129,22 @@ class BedrockClient:
         return access_key, secret_key, session_token, float(exp_epoch)
 
     # -------- Bedrock runtime --------
+    def _fresh_cached_client(self):
+        cached = self._cached
+        if cached and time.time() < (cached.exp_epoch - self.refresh_skew_seconds):
+            return cached.client
+        return None
+
     def _get_bedrock_client(self):
-        now = time.time()
-        if self._cached and now < (self._cached.exp_epoch - self.refresh_skew_seconds):
-            return self._cached.client
+        client = self._fresh_cached_client()
+        if client is not None:
+            return client
+
+        # Requests run on worker threads; only one of them should refresh creds
+        with self._lock:
+            return self._fresh_cached_client() or self._refresh_bedrock_client()
 
+    def _refresh_bedrock_client(self):
         access_key, secret_key, session_token, exp_epoch = self._get_temp_credentials()
         kwargs: dict[str, Any] = {
             "service_name": "bedrock-runtime",
@@ -124,6 +152,7 @@ class BedrockClient:
             "aws_access_key_id": access_key,
             "aws_secret_access_key": secret_key,
             "aws_session_token": session_token,
+            "config": BEDROCK_BOTO_CONFIG,
         }
         if self.endpoint_url:
             kwargs["endpoint_url"] = self.endpoint_url
@@ -141,7 +170,7 @@ class BedrockClient:
     ) -> dict:
         """Invoke the model. body can be a dict (JSON-serialized) or bytes."""
         if isinstance(body, dict):
-            body = json.dumps(body).encode("utf-8")
+            body = to_json(body)
 
         response = self._get_bedrock_client().invoke_model(
             modelId=model_id,
@@ -151,5 +180,5 @@ class BedrockClient:
         )
         response_body = response["body"].read()
         if accept == "application/json":
-            return json.loads(response_body.decode("utf-8"))
+            return from_json(response_body)
         return {"raw": response_body.decode("utf-8")}
\ No newline at end of file
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core's Rust serializer instead of stdlib json.
+
+    Output matches JSONResponse (compact, UTF-8, non-ASCII left unescaped), except
+    that NaN/Infinity are written as null (JSONResponse raises) so the body is
+    always valid JSON.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from src.docs.descriptions import SYSTEM_PROMPT_OBJECTIVE
-from src.inference.utilities import extract_text_from_anthropic_bedrock, safe_json_loads
+from src.inference.utilities import (
+    RESPONSE_CACHE,
+    build_anthropic_body,
+    invoke_bedrock_body,
+    response_cache_key,
+    safe_json_loads,
+)
 from src.models.recommendation import SimpleObjectiveRequest, SimpleRecommendResponse
 
+MAX_TOKENS = 768
+
 
 def validate_and_shape_output(parsed: dict, include_reason: bool, num_recommendations: int) -> dict:
-    if not isinstance(parsed, dict):
+    # Exact type checks: parsed comes from safe_json_loads, which only yields built-in types
+    if type(parsed) is not dict:
         raise ValueError("Model output must be a JSON object")
 
     defining = parsed.get("definingObjectives")
-    if not isinstance(defining, list) or not all(isinstance(x, str) and x.strip() for x in defining):
+    if type(defining) is not list:
         raise ValueError("Model output 'definingObjectives' must be a non-empty list of strings")
 
     if len(defining) < num_recommendations:
@@ -21,12 +29,19 @@ def validate_and_shape_output(parsed: dict, include_reason: bool, num_recommenda
             f"Model returned {len(defining)} definingObjectives but numRecommendations={num_recommendations}"
         )
 
-    defining = [x.strip() for x in defining[:num_recommendations]]
-    out: dict = {"definingObjectives": defining}
+    # Single pass: validate + strip only the items we keep
+    stripped: list[str] = []
+    for x in defining[:num_recommendations]:
+        s = x.strip() if type(x) is str else ""
+        if not s:
+            raise ValueError("Model output 'definingObjectives' must be a non-empty list of strings")
+        stripped.append(s)
+
+    out: dict = {"definingObjectives": stripped}
 
     if include_reason:
         reason = parsed.get("reason")
-        if not isinstance(reason, str) or not reason.strip():
+        if type(reason) is not str or not reason.strip():
             raise ValueError("Model output missing required non-empty 'reason'")
         out["reason"] = reason.strip()
 
@@ -39,24 +54,17 @@ def recommend_objective(
     model_id: str,
 ) -> SimpleRecommendResponse:
     req = payload if isinstance(payload, SimpleObjectiveRequest) else SimpleObjectiveRequest.model_validate(payload)
-    model_input = req.model_dump()
-
-    body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "system": SYSTEM_PROMPT_OBJECTIVE,
-        "messages": [
-            {
-                "role": "user",
-                "content": [{"type": "text", "text": json.dumps(model_input, ensure_ascii=False, indent=2)}],
-            }
-        ],
-        "max_tokens": 768,
-        "temperature": 0.0,
-    }
-
-    resp = bedrock_client.invoke_model(model_id=model_id, body=body)
-    raw_text = extract_text_from_anthropic_bedrock(resp)
-    if not raw_text or not raw_text.strip():
+    user_text = req.model_dump_json()
+
+    # Build the body once: it is both the cache key input and the Bedrock payload
+    body = build_anthropic_body(system=SYSTEM_PROMPT_OBJECTIVE, user_text=user_text, max_tokens=MAX_TOKENS)
+    cache_key = response_cache_key(model_id, body)
+    cached = RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        return SimpleRecommendResponse.model_validate(cached)
+
+    raw_text = invoke_bedrock_body(bedrock_client=bedrock_client, model_id=model_id, body=body)
+    if not raw_text:
         raise ValueError("Bedrock response did not contain model text")
 
     parsed = safe_json_loads(raw_text)
@@ -66,4 +74,6 @@ def recommend_objective(
         num_recommendations=req.numRecommendations,
     )
 
-    return SimpleRecommendResponse.model_validate(shaped)
+    resp = SimpleRecommendResponse.model_validate(shaped)
+    RESPONSE_CACHE.set(cache_key, shaped)
+    return resp
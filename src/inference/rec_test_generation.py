@@ -1,48 +1,49 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from pydantic import ValidationError
+
 from src.docs.descriptions import SYSTEM_PROMPT_JSON_REPAIR, SYSTEM_PROMPT_TEST_GENERATION
-from src.inference.utilities import extract_text_from_anthropic_bedrock, safe_json_loads
+from src.inference.utilities import (
+    RESPONSE_CACHE,
+    build_anthropic_body,
+    invoke_bedrock_body,
+    invoke_bedrock_text,
+    response_cache_key,
+    safe_json_loads_lenient,
+)
 from src.models.test_generation import TestGenerationRequest, TestGenerationResponse
 
-
-def validate_min_counts(parsed: dict, min_cases: int) -> None:
-    tcs = parsed.get("testCases")
-    if not isinstance(tcs, list) or not tcs:
-        raise ValueError("Model output must include non-empty 'testCases' list")
-    if len(tcs) < min_cases:
-        raise ValueError(f"Model returned {len(tcs)} testCases but minimum required is {min_cases}")
+# max_tokens is a ceiling, not a target: never go below the historical 1100, and
+# grow it for large number_of_intents (~200 output tokens per realistic case) so
+# those responses are not cut off. The repair budget covers the largest generation.
+MIN_MAX_TOKENS = 1100
+BASE_MAX_TOKENS = 200
+MAX_TOKENS_PER_CASE = 200
+MAX_TOKENS_CAP = 2200
+REPAIR_MAX_TOKENS = 2400
 
 
-def invoke_bedrock_text(bedrock_client: Any, model_id: str, system: str, user_text: str, max_tokens: int) -> str:
-    body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "system": system,
-        "messages": [{"role": "user", "content": [{"type": "text", "text": user_text}]}],
-        "max_tokens": max_tokens,
-        "temperature": 0.0,
-    }
-    resp = bedrock_client.invoke_model(model_id=model_id, body=body)
-    raw = extract_text_from_anthropic_bedrock(resp)
-    return (raw or "").strip()
+def max_tokens_for(number_of_intents: int) -> int:
+    return min(MAX_TOKENS_CAP, max(MIN_MAX_TOKENS, BASE_MAX_TOKENS + MAX_TOKENS_PER_CASE * number_of_intents))
 
 
 def parse_or_repair_json(raw_text: str, bedrock_client: Any, model_id: str) -> dict:
+    # Repair locally first; only pay for another Bedrock round-trip if that fails
     try:
-        return safe_json_loads(raw_text)
-    except Exception:
+        return safe_json_loads_lenient(raw_text)
+    except ValueError:
         repaired_text = invoke_bedrock_text(
             bedrock_client=bedrock_client,
             model_id=model_id,
             system=SYSTEM_PROMPT_JSON_REPAIR,
             user_text=raw_text,
-            max_tokens=1400,
+            max_tokens=REPAIR_MAX_TOKENS,
         )
         if not repaired_text:
             raise ValueError("Model returned invalid JSON and repair step returned empty text.")
-        return safe_json_loads(repaired_text)
+        return safe_json_loads_lenient(repaired_text)
 
 
 def generate_test_cases(
@@ -51,26 +52,40 @@ def generate_test_cases(
     model_id: str,
 ) -> TestGenerationResponse:
     req = payload if isinstance(payload, TestGenerationRequest) else TestGenerationRequest.model_validate(payload)
-    model_input = req.model_dump()
-
-    gen_text = invoke_bedrock_text(
-        bedrock_client=bedrock_client,
-        model_id=model_id,
-        system=SYSTEM_PROMPT_TEST_GENERATION,
-        user_text=json.dumps(model_input, ensure_ascii=False, indent=2),
-        max_tokens=1100,
-    )
+    user_text = req.model_dump_json()
+    max_tokens = max_tokens_for(req.context.number_of_intents)
+
+    # Build the body once: it is both the cache key input and the Bedrock payload
+    body = build_anthropic_body(system=SYSTEM_PROMPT_TEST_GENERATION, user_text=user_text, max_tokens=max_tokens)
+    cache_key = response_cache_key(model_id, body)
+    cached = RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        return TestGenerationResponse.model_validate_json(cached)
+
+    gen_text = invoke_bedrock_body(bedrock_client=bedrock_client, model_id=model_id, body=body)
     if not gen_text:
         raise ValueError("Bedrock response did not contain model text")
 
-    parsed = parse_or_repair_json(gen_text, bedrock_client=bedrock_client, model_id=model_id)
-    if not isinstance(parsed, dict):
-        raise ValueError("Model output must be a JSON object")
-
-    validate_min_counts(parsed, min_cases=req.context.number_of_intents)
+    try:
+        # Happy path: clean JSON is parsed and validated in one pydantic-core pass
+        resp = TestGenerationResponse.model_validate_json(gen_text)
+    except ValidationError:
+        parsed = parse_or_repair_json(gen_text, bedrock_client=bedrock_client, model_id=model_id)
+        if type(parsed) is not dict:
+            raise ValueError("Model output must be a JSON object")
+        # domain/language are forced below, so tolerate the model omitting them
+        parsed["domain"] = req.domain
+        parsed["language"] = req.context.language
+        resp = TestGenerationResponse.model_validate(parsed)
 
     # Force request truth (prevents model drift)
-    parsed["domain"] = req.domain
-    parsed["language"] = req.context.language
+    resp.domain = req.domain
+    resp.language = req.context.language
+
+    # Pydantic has enforced list-ness; number_of_intents >= 1 also rules out an empty list
+    min_cases = req.context.number_of_intents
+    if len(resp.testCases) < min_cases:
+        raise ValueError(f"Model returned {len(resp.testCases)} testCases but minimum required is {min_cases}")
 
-    return TestGenerationResponse.model_validate(parsed)
+    RESPONSE_CACHE.set(cache_key, resp.model_dump_json())
+    return resp
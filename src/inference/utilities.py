@@ -1,6 +1,71 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import re
+import threading
+from functools import lru_cache
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+from src.inference.cache import TTLCache
+
+# Either a complete JSON string literal (kept verbatim) or a comma that only has
+# whitespace before the next } / ] (dropped). Matching strings first keeps commas
+# inside values such as "a,}" intact.
+_TRAILING_COMMA_RE = re.compile(r'"(?:[^"\\]|\\.)*"|,(?=\s*[}\]])')
+
+# Cheap pre-check for the above (may match inside strings; only gates the repair attempt)
+_TRAILING_COMMA_HINT_RE = re.compile(r",\s*[}\]]")
+
+# Curly double quotes used as JSON delimiters; one str.translate pass
+_SMART_QUOTE_TABLE = str.maketrans({"\u201c": '"', "\u201d": '"'})
+
+# Invariant part of every Anthropic-on-Bedrock request body
+_BODY_TEMPLATE = {"anthropic_version": "bedrock-2023-05-31", "temperature": 0.0}
+
+# Single user turn, pre-encoded around the (JSON-escaped) text slot
+_USER_MESSAGES_HEAD = b'[{"role":"user","content":[{"type":"text","text":'
+_USER_MESSAGES_TAIL = b"}]}]"
+
+# Cap on in-flight Bedrock calls per worker, so bursts queue here instead of being
+# throttled. Held only around invoke_model: cache hits and parsing never wait on
+# it, and a repair round-trip takes its own slot.
+BEDROCK_MAX_CONCURRENCY = 10
+_BEDROCK_SLOTS = threading.BoundedSemaphore(BEDROCK_MAX_CONCURRENCY)
+
+# Validated responses keyed on (model_id, request body); safe because temperature is 0.0
+RESPONSE_CACHE = TTLCache(maxsize=1024, ttl_seconds=3600)
+
+
+@lru_cache(maxsize=8)
+def _encoded_body_head(system: str) -> bytes:
+    """
+    JSON-encoded body prefix (template + system prompt), without the closing brace.
+
+    System prompts are multi-KB constants, so escape/encode them once per prompt
+    instead of on every request.
+    """
+    return to_json({**_BODY_TEMPLATE, "system": system})[:-1]
+
+
+def _user_messages_json(user_text: str) -> bytes:
+    """JSON for messages=[{"role": "user", "content": [{"type": "text", "text": user_text}]}]."""
+    return _USER_MESSAGES_HEAD + to_json(user_text) + _USER_MESSAGES_TAIL
+
+
+def build_anthropic_body(system: str, user_text: str, max_tokens: int) -> bytes:
+    """Serialized single-turn Anthropic request body."""
+    return b"".join(
+        (
+            _encoded_body_head(system),
+            b',"max_tokens":',
+            str(int(max_tokens)).encode("ascii"),
+            b',"messages":',
+            _user_messages_json(user_text),
+            b"}",
+        )
+    )
 
 
 def extract_text_from_anthropic_bedrock(resp: dict) -> str:
@@ -30,16 +95,79 @@ def extract_text_from_anthropic_bedrock(resp: dict) -> str:
     return ""
 
 
+def invoke_bedrock_body(bedrock_client: Any, model_id: str, body: bytes) -> str:
+    """Send a pre-built request body and return the stripped model text ("" if none)."""
+    with _BEDROCK_SLOTS:
+        resp = bedrock_client.invoke_model(model_id=model_id, body=body)
+    raw = extract_text_from_anthropic_bedrock(resp)
+    return (raw or "").strip()
+
+
+def invoke_bedrock_text(bedrock_client: Any, model_id: str, system: str, user_text: str, max_tokens: int) -> str:
+    """Send a single-turn Anthropic request and return the stripped model text ("" if none)."""
+    body = build_anthropic_body(system=system, user_text=user_text, max_tokens=max_tokens)
+    return invoke_bedrock_body(bedrock_client=bedrock_client, model_id=model_id, body=body)
+
+
+def response_cache_key(model_id: str, body: bytes) -> bytes:
+    """
+    RESPONSE_CACHE key for a request. Hashes the exact Bedrock body, so the
+    system prompt, max_tokens and temperature are all part of the key.
+    """
+    return hashlib.blake2b(model_id.encode("utf-8") + b"|" + body, digest_size=16).digest()
+
+
 def safe_json_loads(text: str) -> dict:
     """
     Parse JSON, with a small recovery attempt if the model included extra text.
+
+    Uses pydantic-core's Rust parser (raises ValueError on invalid input).
     """
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return from_json(text)
+    except ValueError:
         # Recovery: extract the first {...} block
         start = text.find("{")
         end = text.rfind("}")
         if start != -1 and end != -1 and end > start:
-            return json.loads(text[start : end + 1])
+            return from_json(text[start : end + 1])
         raise
+
+
+def _drop_trailing_comma(m: re.Match[str]) -> str:
+    tok = m.group(0)
+    return "" if tok == "," else tok
+
+
+def _strip_trailing_commas(text: str) -> str:
+    """Remove trailing commas outside string literals in a single linear scan."""
+    return _TRAILING_COMMA_RE.sub(_drop_trailing_comma, text)
+
+
+def _normalize_quotes(text: str) -> str:
+    return text.translate(_SMART_QUOTE_TABLE)
+
+
+def safe_json_loads_lenient(text: str) -> dict:
+    """
+    safe_json_loads plus cheap local repairs for common model mistakes
+    (trailing commas, then curly-quote delimiters). Code fences and surrounding
+    prose are already handled by the {...} slice in safe_json_loads.
+    """
+    try:
+        return safe_json_loads(text)
+    except ValueError:
+        has_commas = _TRAILING_COMMA_HINT_RE.search(text) is not None
+        has_smart_quotes = "\u201c" in text or "\u201d" in text
+        if not (has_commas or has_smart_quotes):
+            raise  # nothing a local repair could fix
+
+    if has_commas:
+        try:
+            return safe_json_loads(_strip_trailing_commas(text))
+        except ValueError:
+            if not has_smart_quotes:
+                raise
+
+    # Last resort: curly quotes inside values are legitimate, so only rewrite them now
+    return safe_json_loads(_strip_trailing_commas(_normalize_quotes(text)))
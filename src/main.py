@@ -1,12 +1,18 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from fastapi import FastAPI, HTTPException, Security, Body
 from fastapi.security.api_key import APIKeyHeader
 
 from src.core.config import Config
+from src.core.responses import FastJSONResponse
 from src.core.bedrock_client import BedrockClient as CognitoBedrockClient
 from src.local.bedrock_client import BedrockClient as LocalBedrockClient
 
 from src.inference.rec_objective import recommend_objective
 from src.inference.rec_test_generation import generate_test_cases
+from src.inference.utilities import BEDROCK_MAX_CONCURRENCY
 
 from src.models.recommendation import SimpleObjectiveRequest, SimpleRecommendResponse
 from src.models.test_generation import TestGenerationRequest, TestGenerationResponse
@@ -28,6 +34,16 @@ if not env:
 if env != env.lower():
     raise RuntimeError(f"ENV must be lowercase (got: {env!r}). Expected e.g. 'local', 'dev', 'prod'.")
 
+# Immutable after startup: read once and fail fast instead of 500-ing every request
+expected_api_key = config.get("api_key")
+if not expected_api_key:
+    raise RuntimeError("Missing required config key: api_key (set API_KEY via env vars or Secrets Manager).")
+bedrock_model_id = config.get("bedrock_model_id")
+if not bedrock_model_id:
+    raise RuntimeError(
+        "Missing required config key: bedrock_model_id (set BEDROCK_MODEL_ID via env vars or Secrets Manager)."
+    )
+
 # Always use Cognito unless local
 if env == "local":
     print("Using LOCAL mock Bedrock client (env=local)")
@@ -47,6 +63,17 @@ app = FastAPI(
     title="Objective Recommendation API",
     version="2.0.0",
     description=API_DESCRIPTION,
+    default_response_class=FastJSONResponse,
+)
+
+# Dedicated pool for blocking inference. The Bedrock cap lives in invoke_bedrock_body;
+# the other BEDROCK_MAX_CONCURRENCY threads serve cache hits and parsing while calls
+# wait on it. That only holds up to that many blocked misses: with more than
+# 2 * BEDROCK_MAX_CONCURRENCY concurrent misses, every thread is busy and cache hits
+# queue too. (The default executor has only min(32, cpu + 4) threads.)
+inference_executor = ThreadPoolExecutor(
+    max_workers=2 * BEDROCK_MAX_CONCURRENCY,
+    thread_name_prefix="inference",
 )
 
 api_key_scheme = APIKeyHeader(
@@ -57,13 +84,16 @@ api_key_scheme = APIKeyHeader(
 
 
 def verify_api_key(api_key: str | None):
-    expected = config.get("api_key")
-    if not expected:
-        raise HTTPException(status_code=500, detail="API_KEY is not configured")
-    if not api_key or api_key != expected:
+    if not api_key or api_key != expected_api_key:
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
 
+async def run_inference(fn, req):
+    # boto3 is blocking; keep the event loop free while Bedrock generates
+    call = partial(fn, req, bedrock_client=bedrock_client, model_id=bedrock_model_id)
+    return await asyncio.get_running_loop().run_in_executor(inference_executor, call)
+
+
 @app.post(
     f"/{env}/recommendation",
     response_model=SimpleRecommendResponse,
@@ -77,12 +107,8 @@ async def handle_recommendation(
 ):
     verify_api_key(api_key)
 
-    model_id = config.get("bedrock_model_id")
-    if not model_id:
-        raise HTTPException(status_code=500, detail="BEDROCK_MODEL_ID is not configured")
-
     try:
-        return recommend_objective(req, bedrock_client=bedrock_client, model_id=model_id)
+        return await run_inference(recommend_objective, req)
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
 
@@ -99,11 +125,7 @@ async def handle_test_generation(
 ):
     verify_api_key(api_key)
 
-    model_id = config.get("bedrock_model_id")
-    if not model_id:
-        raise HTTPException(status_code=500, detail="BEDROCK_MODEL_ID is not configured")
-
     try:
-        return generate_test_cases(req, bedrock_client=bedrock_client, model_id=model_id)
+        return await run_inference(generate_test_cases, req)
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from src.inference import cache as cache_module
+from src.inference.cache import TTLCache
+from src.inference.rec_objective import recommend_objective
+from src.inference.rec_test_generation import generate_test_cases
+from src.inference.utilities import RESPONSE_CACHE
+
+
+class _StubBedrock:
+    """Always returns the same model text and counts invoke_model calls."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.calls = 0
+
+    def invoke_model(self, model_id, body):
+        self.calls += 1
+        return {"content": [{"type": "text", "text": self.text}], "stop_reason": "end_turn"}
+
+
+_OBJECTIVE_TEXT = json.dumps({"definingObjectives": ["a", "b", "c"], "reason": "vague"})
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    RESPONSE_CACHE.clear()
+    yield
+    RESPONSE_CACHE.clear()
+
+
+# -------- TTLCache --------
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    c = TTLCache(maxsize=4, ttl_seconds=10)
+
+    c.set("k", "v")
+    now[0] += 9.9
+    assert c.get("k") == "v"
+    now[0] += 0.1
+    assert c.get("k") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    c = TTLCache(maxsize=2, ttl_seconds=60)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1  # "b" is now the oldest
+
+    c.set("c", 3)
+
+    assert c.get("b") is None
+    assert (c.get("a"), c.get("c")) == (1, 3)
+
+
+# -------- RESPONSE_CACHE in the inference functions --------
+def test_identical_recommendation_request_skips_bedrock():
+    client = _StubBedrock(_OBJECTIVE_TEXT)
+    payload = {"objective": "make it better", "numRecommendations": 3}
+
+    first = recommend_objective(payload, client, "m")
+    second = recommend_objective(payload, client, "m")
+
+    assert second == first
+    assert client.calls == 1
+
+
+def test_different_include_reason_misses_cache():
+    client = _StubBedrock(_OBJECTIVE_TEXT)
+
+    recommend_objective({"objective": "make it better", "includeReason": True}, client, "m")
+    resp = recommend_objective({"objective": "make it better", "includeReason": False}, client, "m")
+
+    assert resp.reason is None
+    assert client.calls == 2
+
+
+def test_different_max_tokens_misses_cache():
+    cases = [{"name": f"case {i}", "description": "d"} for i in range(10)]
+    client = _StubBedrock(json.dumps({"domain": "d", "language": "en", "testCases": cases}))
+
+    # number_of_intents 5 and 6 are sized to different max_tokens (1200 vs 1400)
+    generate_test_cases({"domain": "d", "context": {"description": "x", "number_of_intents": 5}}, client, "m")
+    generate_test_cases({"domain": "d", "context": {"description": "x", "number_of_intents": 6}}, client, "m")
+
+    assert client.calls == 2
+
+
+def test_invalid_output_is_not_cached():
+    client = _StubBedrock(json.dumps({"definingObjectives": ["only one"], "reason": "r"}))
+    payload = {"objective": "make it better", "numRecommendations": 3}
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="numRecommendations=3"):
+            recommend_objective(payload, client, "m")
+
+    assert client.calls == 2
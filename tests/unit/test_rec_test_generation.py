@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from src.docs.descriptions import SYSTEM_PROMPT_JSON_REPAIR
+from src.inference.rec_test_generation import generate_test_cases
+from src.inference.utilities import RESPONSE_CACHE
+
+
+class _StubBedrock:
+    """Returns the queued model texts in order and records every request body."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.bodies: list[dict] = []
+
+    def invoke_model(self, model_id, body):
+        self.bodies.append(json.loads(body))
+        text, stop_reason = self.replies.pop(0)
+        return {"content": [{"type": "text", "text": text}], "stop_reason": stop_reason}
+
+
+def _cases_json(n: int) -> str:
+    cases = [{"name": f"case {i}", "description": f"covers {i}"} for i in range(n)]
+    return json.dumps({"domain": "telecom_billing", "language": "en", "testCases": cases})
+
+
+def _payload(number_of_intents: int = 3) -> dict:
+    return {
+        "domain": "telecom_billing",
+        "context": {"description": "Billing bot", "number_of_intents": number_of_intents},
+    }
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    RESPONSE_CACHE.clear()
+    yield
+    RESPONSE_CACHE.clear()
+
+
+def test_truncated_output_is_repaired_and_succeeds():
+    full = _cases_json(5)
+    client = _StubBedrock((full[: len(full) // 2], "max_tokens"), (full, "end_turn"))
+
+    resp = generate_test_cases(_payload(3), client, "m")
+
+    assert len(resp.testCases) == 5
+    assert len(client.bodies) == 2
+
+
+def test_clean_json_gets_request_domain_and_language_forced():
+    text = json.dumps({"domain": "wrong", "language": "fr", "testCases": json.loads(_cases_json(3))["testCases"]})
+    client = _StubBedrock((text, "end_turn"))
+
+    resp = generate_test_cases(_payload(3), client, "m")
+
+    assert (resp.domain, resp.language) == ("telecom_billing", "en")
+    assert len(client.bodies) == 1
+
+
+def test_fenced_output_without_domain_uses_local_fallback():
+    cases = ",".join(json.dumps({"name": f"case {i}", "description": "d"}) for i in range(3))
+    text = f'```json\n{{"testCases": [{cases},],}}\n```'
+    client = _StubBedrock((text, "end_turn"))
+
+    resp = generate_test_cases(_payload(3), client, "m")
+
+    assert (resp.domain, resp.language) == ("telecom_billing", "en")
+    assert [c.name for c in resp.testCases] == ["case 0", "case 1", "case 2"]
+    assert len(client.bodies) == 1
+
+
+def test_too_few_cases_raises_count_message():
+    client = _StubBedrock((_cases_json(2), "end_turn"))
+
+    with pytest.raises(ValueError, match="Model returned 2 testCases but minimum required is 3"):
+        generate_test_cases(_payload(3), client, "m")
+
+
+def test_garbage_triggers_exactly_one_repair_call():
+    client = _StubBedrock(("Sorry, here are some tests: none", "end_turn"), (_cases_json(3), "end_turn"))
+
+    resp = generate_test_cases(_payload(3), client, "m")
+
+    assert len(resp.testCases) == 3
+    assert len(client.bodies) == 2
+    assert client.bodies[1]["system"] == SYSTEM_PROMPT_JSON_REPAIR
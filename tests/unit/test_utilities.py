@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from src.inference.utilities import (
+    _encoded_body_head,
+    _strip_trailing_commas,
+    build_anthropic_body,
+    invoke_bedrock_body,
+    safe_json_loads_lenient,
+)
+
+
+# -------- _strip_trailing_commas --------
+def test_strip_trailing_commas_removes_object_and_array_commas():
+    assert _strip_trailing_commas('{"a": [1, 2,], "b": 3,}') == '{"a": [1, 2], "b": 3}'
+
+
+def test_strip_trailing_commas_allows_whitespace_before_closer():
+    assert _strip_trailing_commas('{"a": 1,\n  }') == '{"a": 1\n  }'
+
+
+def test_strip_trailing_commas_keeps_commas_inside_strings():
+    text = '{"a": "x,}", "b": ["y,]"]}'
+    assert _strip_trailing_commas(text) == text
+
+
+def test_strip_trailing_commas_handles_escaped_quotes():
+    text = '{"a": "say \\",}\\" ok", "b": [1,],}'
+    out = _strip_trailing_commas(text)
+    assert json.loads(out) == {"a": 'say ",}" ok', "b": [1]}
+
+
+def test_strip_trailing_commas_handles_escaped_backslash_before_quote():
+    text = '{"a": "\\\\", }'
+    assert json.loads(_strip_trailing_commas(text)) == {"a": "\\"}
+
+
+# -------- safe_json_loads_lenient --------
+def test_lenient_parses_valid_json_unchanged():
+    assert safe_json_loads_lenient('{"a": "x,}"}') == {"a": "x,}"}
+
+
+def test_lenient_strips_code_fences_and_trailing_commas():
+    text = 'Here you go:\n```json\n{"a": [1, 2,],}\n```'
+    assert safe_json_loads_lenient(text) == {"a": [1, 2]}
+
+
+def test_lenient_repairs_curly_quote_delimiters():
+    assert safe_json_loads_lenient("{“a”: [“x”]}") == {"a": ["x"]}
+
+
+def test_lenient_keeps_curly_quotes_inside_values():
+    text = '{"a": "say “hi”",}'
+    assert safe_json_loads_lenient(text) == {"a": "say “hi”"}
+
+
+@pytest.mark.parametrize("text", ["not json", '{"a": 1', '{"a": [1,]', "{“a”: x}"])
+def test_lenient_raises_value_error_when_unrepairable(text):
+    with pytest.raises(ValueError):
+        safe_json_loads_lenient(text)
+
+
+# -------- build_anthropic_body --------
+def test_build_anthropic_body_round_trips_through_json():
+    system = 'System "prompt" with é and\nnewlines'
+    user_text = '{"objective": "x é", "q": "\\"quoted\\"\\n"}'
+
+    body = build_anthropic_body(system=system, user_text=user_text, max_tokens=768)
+
+    assert json.loads(body) == {
+        "anthropic_version": "bedrock-2023-05-31",
+        "temperature": 0.0,
+        "system": system,
+        "max_tokens": 768,
+        "messages": [{"role": "user", "content": [{"type": "text", "text": user_text}]}],
+    }
+
+
+def test_build_anthropic_body_reuses_head_across_user_texts():
+    _encoded_body_head.cache_clear()
+    a = json.loads(build_anthropic_body(system="s", user_text="one", max_tokens=10))
+    b = json.loads(build_anthropic_body(system="s", user_text="two", max_tokens=20))
+    assert a["messages"][0]["content"][0]["text"] == "one"
+    assert b["messages"][0]["content"][0]["text"] == "two"
+    assert b["max_tokens"] == 20
+    info = _encoded_body_head.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+# -------- invoke_bedrock_body --------
+class _StubBedrock:
+    def __init__(self, stop_reason):
+        self.stop_reason = stop_reason
+
+    def invoke_model(self, model_id, body):
+        return {"content": [{"type": "text", "text": ' {"a": 1} '}], "stop_reason": self.stop_reason}
+
+
+def test_invoke_bedrock_body_returns_stripped_text():
+    assert invoke_bedrock_body(_StubBedrock("end_turn"), "m", b"{}") == '{"a": 1}'
+
+
+def test_invoke_bedrock_body_returns_text_cut_off_at_max_tokens():
+    # Truncated output is still handed back so the callers' repair path can close it
+    assert invoke_bedrock_body(_StubBedrock("max_tokens"), "m", b"{}") == '{"a": 1}'